@@ -2,83 +2,115 @@
 """
 Extract component version information from vLLM repository for RHAI Release spreadsheet.
 
-This tool clones a vLLM repository at a specific tag/ref and extracts version information
-for all components needed in the "RHAI Release to Component Version Mapping" spreadsheet
-(rows 16-54).
+This tool fetches a vLLM repository at a specific tag/ref into a local bare cache and
+reads version information straight from git objects for all components needed in the
+"RHAI Release to Component Version Mapping" spreadsheet (rows 16-54).
 """
 
+import io
 import re
+import operator
+import functools
 import subprocess
-import tempfile
 import argparse
 import sys
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Tuple
 
+from git_blob_reader import GitBlobReader, GitBlobReaderError
+from repo_cache import get_or_update_cache
 
-def clone_vllm_repo(temp_dir: Path, repo_url: str, ref: str) -> Path:
-    """Clone the vLLM repository to a temporary directory and checkout ref."""
-    vllm_path = temp_dir / "vllm"
-    print(f"Cloning vLLM repository from {repo_url}...", file=sys.stderr)
-    subprocess.run([
-        "git", "clone", repo_url, str(vllm_path)
-    ], check=True, capture_output=True)
 
-    print(f"Checking out {ref}...", file=sys.stderr)
-    subprocess.run([
-        "git", "checkout", ref
-    ], cwd=vllm_path, check=True, capture_output=True)
+# Patterns used on every line of the parsed files, compiled once at import time
+_URL_PKG_RE = re.compile(r'^([^\s\[]+)(?:\[[^\]]+\])?\s*@')
+_GIT_COMMIT_RE = re.compile(r'@([0-9a-f]{40})')
+_URL_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+(?:\.dev\d+)?)')
+_PKG_LINE_RE = re.compile(r'^([a-zA-Z0-9_-]+)(?:\[[^\]]+\])?\s*([><=!]+\s*[\d\.\w\+]+(?:\s*,\s*[><=!]+\s*[\d\.\w\+]+)*)?')
+# Lower bound (>=) and exact (==) constraints in one alternation; see parse_package_line
+_VERSION_SPEC_RE = re.compile(
+    r'>=?\s*(?P<lb>\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)'
+    r'|==\s*(?P<eq>\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)'
+)
+_UPPER_BOUND_RE = re.compile(r'^\s*<[=]?\s*[\d\.]+')
+_VERSION_RE = re.compile(r'(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)')
+_REQUIRES_PYTHON_RE = re.compile(r'^\s*requires-python\s*=\s*">=(\d+\.\d+)')
+_ROCM_TAG_RE = re.compile(r':(\d+\.\d+)')
+_GCC_RE = re.compile(r'gcc-(\d+)')
+_ARG_RE = re.compile(r'^\s*ARG\s+([^\s=]+)=(.+)$')
+_SHELL_ASSIGN_RE = re.compile(r'^([^\s=]+)=')
 
-    return vllm_path
 
+_HEXSET = frozenset("0123456789abcdef")
 
-def safe_extract(extraction_func, *args, default="[tbd]", **kwargs):
-    """Safely execute extraction function with fallback to default."""
-    try:
-        result = extraction_func(*args, **kwargs)
-        return result if result is not None else default
-    except Exception as e:
-        print(f"Warning: {extraction_func.__name__} failed: {e}", file=sys.stderr)
-        return default
-
-
-def parse_dockerfile_arg(repo_path: Path, dockerfile: str, arg_name: str) -> Optional[str]:
-    """Parse ARG variable from Dockerfile."""
-    dockerfile_path = repo_path / "docker" / dockerfile
-    if not dockerfile_path.exists():
-        return None
-
-    with open(dockerfile_path, 'r') as f:
-        for line in f:
-            # Match: ARG ARG_NAME=value or ARG ARG_NAME="value"
-            match = re.match(rf'^\s*ARG\s+{arg_name}=(.+)$', line.strip())
-            if match:
-                value = match.group(1).strip('"').strip("'")
-                return value
-    return None
-
-
-def parse_script_var(repo_path: Path, script_path: str, var_name: str) -> Optional[str]:
-    """Parse shell variable from script file."""
-    full_path = repo_path / script_path
-    if not full_path.exists():
-        return None
-
-    with open(full_path, 'r') as f:
-        for line in f:
-            # Match: VAR_NAME=${VAR_NAME:-"value"}
-            match = re.match(rf'{var_name}=\$\{{{var_name}:-"([^"]+)"\}}', line.strip())
-            if match:
-                return match.group(1)
-            # Match: VAR_NAME="value"
-            match = re.match(rf'{var_name}="([^"]+)"', line.strip())
-            if match:
-                return match.group(1)
-            # Match: VAR_NAME=value (no quotes)
-            match = re.match(rf'{var_name}=([^\s#]+)', line.strip())
-            if match:
-                return match.group(1)
-    return None
+
+def _is_hex(s: str) -> bool:
+    """Return True if s is non-empty and made only of lowercase hex digits."""
+    return bool(s) and all(c in _HEXSET for c in s)
+
+
+def _is_hex_commit(s: str, min_len: int = 7) -> bool:
+    """Return True if s looks like a (possibly abbreviated) git commit hash."""
+    return len(s) >= min_len and _is_hex(s)
+
+
+@functools.lru_cache(maxsize=64)
+def _script_var_re(var_name: str) -> re.Pattern:
+    """
+    Compiled pattern for a shell assignment, trying in order:
+    VAR_NAME=${VAR_NAME:-"value"}, VAR_NAME="value", VAR_NAME=value (no quotes).
+    """
+    var = re.escape(var_name)
+    return re.compile(rf'{var}=(?:\$\{{{var}:-"([^"]+)"\}}|"([^"]+)"|([^\s#]+))')
+
+
+def safe_extract(extraction_func, ctx: "ExtractionContext", *args, default="[tbd]", **kwargs):
+    """Safely execute extraction function with fallback to default, memoized on ctx."""
+    key = (extraction_func.__qualname__, args, tuple(sorted(kwargs.items())))
+    if key not in ctx.results:
+        try:
+            ctx.results[key] = extraction_func(ctx, *args, **kwargs)
+        except GitBlobReaderError:
+            raise  # The repo itself is unreadable; a report of defaults would hide that
+        except Exception as e:
+            print(f"Warning: {extraction_func.__name__} failed: {e}", file=sys.stderr)
+            ctx.results[key] = None
+    result = ctx.results[key]
+    return result if result is not None else default
+
+
+def parse_dockerfile_args(content: str) -> Dict[str, str]:
+    """Parse every ARG in a Dockerfile in one pass; the first definition of a name wins."""
+    args = {}
+    for line in content.splitlines():
+        # Cheap prefix/substring checks keep the regex off non-ARG lines
+        line = line.strip()
+        if not line.startswith("ARG") or "=" not in line:
+            continue
+        # Match: ARG ARG_NAME=value or ARG ARG_NAME="value"
+        match = _ARG_RE.match(line)
+        if match:
+            args.setdefault(match.group(1), match.group(2).strip('"').strip("'"))
+    return args
+
+
+def parse_script_vars(content: str) -> Dict[str, str]:
+    """Parse every shell variable assignment in a script in one pass; the first one wins."""
+    script_vars = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if "=" not in line or line.startswith("#"):
+            continue
+        assignment = _SHELL_ASSIGN_RE.match(line)
+        if not assignment or assignment.group(1) in script_vars:
+            continue
+
+        var_name = assignment.group(1)
+        match = _script_var_re(var_name).match(line)
+        if match:
+            script_vars[var_name] = next(g for g in match.groups() if g is not None)
+    return script_vars
 
 
 def parse_package_line(line: str) -> Tuple[str, str]:
@@ -94,46 +126,50 @@ def parse_package_line(line: str) -> Tuple[str, str]:
 
     # Handle URL-based packages (torch_xla, git repos)
     if '@' in line and 'http' in line:
-        match = re.match(r'^([^\s\[]+)(?:\[[^\]]+\])?\s*@', line)
+        match = _URL_PKG_RE.match(line)
         if match:
             pkg_name = match.group(1)
 
             # Extract git commit hash (40 hex characters)
-            git_commit_match = re.search(r'@([0-9a-f]{40})', line)
+            git_commit_match = _GIT_COMMIT_RE.search(line)
             if git_commit_match:
                 # Use short form (first 8 characters)
                 version = git_commit_match.group(1)[:8]
                 return pkg_name, version
 
             # Otherwise extract semantic version from URL
-            version_match = re.search(r'(\d+\.\d+\.\d+(?:\.dev\d+)?)', line)
+            version_match = _URL_VERSION_RE.search(line)
             version = version_match.group(1) if version_match else "unknown"
             return pkg_name, version
 
     # Handle standard package specifications
-    match = re.match(r'^([a-zA-Z0-9_-]+)(?:\[[^\]]+\])?\s*([><=!]+\s*[\d\.\w\+]+(?:\s*,\s*[><=!]+\s*[\d\.\w\+]+)*)?', line)
+    match = _PKG_LINE_RE.match(line)
     if match:
         pkg_name = match.group(1)
         version_spec = match.group(2) if match.group(2) else ""
 
         if version_spec:
-            # Prefer lower bounds (>=) over upper bounds (<)
-            lower_bound_match = re.search(r'>=?\s*(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)', version_spec)
-            if lower_bound_match:
-                version = lower_bound_match.group(1)
+            # One scan finds every >= and == constraint; prefer lower bounds (>=)
+            # over exact versions (==), wherever they appear in the spec
+            lower_bound = exact = None
+            for spec_match in _VERSION_SPEC_RE.finditer(version_spec):
+                if spec_match.lastgroup == 'lb':
+                    lower_bound = spec_match.group('lb')
+                    break
+                if exact is None:
+                    exact = spec_match.group('eq')
+
+            if lower_bound:
+                version = lower_bound
+            elif exact:
+                version = exact
+            # Keep full constraint if only upper bound
+            elif _UPPER_BOUND_RE.match(version_spec.strip()):
+                version = version_spec.strip()
             else:
-                # Try exact version (==)
-                exact_match = re.search(r'==\s*(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)', version_spec)
-                if exact_match:
-                    version = exact_match.group(1)
-                else:
-                    # Keep full constraint if only upper bound
-                    if re.match(r'^\s*<[=]?\s*[\d\.]+', version_spec.strip()):
-                        version = version_spec.strip()
-                    else:
-                        # Fall back to any version number found
-                        version_match = re.search(r'(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)', version_spec)
-                        version = version_match.group(1) if version_match else version_spec.strip()
+                # Fall back to any version number found
+                version_match = _VERSION_RE.search(version_spec)
+                version = version_match.group(1) if version_match else version_spec.strip()
         else:
             version = "latest"
 
@@ -142,106 +178,147 @@ def parse_package_line(line: str) -> Tuple[str, str]:
     return None, None
 
 
-def parse_requirements_file(repo_path: Path, req_file: str, package_name: str) -> Optional[str]:
-    """Extract version for specific package from requirements file."""
-    req_path = repo_path / "requirements" / req_file
-    if not req_path.exists():
-        return None
+def parse_requirements(content: str) -> Dict[str, str]:
+    """Parse a requirements file once into {package_name_lower: version}; the first line wins."""
+    packages = {}
+    for line in content.splitlines():
+        pkg_name, version = parse_package_line(line)
+        if pkg_name:
+            packages.setdefault(pkg_name.lower(), version)
+    return packages
+
 
-    with open(req_path, 'r') as f:
-        for line in f:
-            pkg_name, version = parse_package_line(line)
-            if pkg_name and pkg_name.lower() == package_name.lower():
-                return version
-    return None
+@dataclass(eq=False)
+class ExtractionContext:
+    """
+    Everything the extractors need for one ref.
+
+    Each file is read from the repo and parsed at most once, on first use, so extractors
+    that share a file (e.g. Dockerfile.rocm_base for aiter and flash_attn) do not rescan it.
+    Results of safe_extract are memoized here as well.
+    """
+    repo: GitBlobReader
+    ref: str
+    results: Dict[tuple, object] = field(default_factory=dict)
+    _texts: Dict[str, Optional[str]] = field(default_factory=dict)
+    _parsed: Dict[Tuple[str, str], Dict[str, str]] = field(default_factory=dict)
+    _locks: Dict[object, threading.Lock] = field(default_factory=dict)
+
+    def _once(self, cache: dict, key, compute):
+        """Return cache[key], computing it exactly once even when extractors run in threads."""
+        if key not in cache:
+            # dict.setdefault is atomic, so all threads agree on one lock per key
+            with self._locks.setdefault(key, threading.Lock()):
+                if key not in cache:
+                    cache[key] = compute()
+        return cache[key]
+
+    def read_text(self, path: str) -> Optional[str]:
+        """Return the contents of path at this ref, or None if it does not exist."""
+        return self._once(self._texts, path, lambda: self.repo.read_text(self.ref, path))
+
+    def _parse(self, path: str, parser) -> Dict[str, str]:
+        def compute():
+            content = self.read_text(path)
+            return parser(content) if content is not None else {}
+        return self._once(self._parsed, (path, parser.__name__), compute)
+
+    def dockerfile_args(self, dockerfile: str) -> Dict[str, str]:
+        """ARG values from docker/<dockerfile>."""
+        return self._parse(f"docker/{dockerfile}", parse_dockerfile_args)
+
+    def script_vars(self, script_path: str) -> Dict[str, str]:
+        """Shell variable values from a script."""
+        return self._parse(script_path, parse_script_vars)
+
+    def requirements(self, req_file: str) -> Dict[str, str]:
+        """{package_name_lower: version} from requirements/<req_file>."""
+        return self._parse(f"requirements/{req_file}", parse_requirements)
 
 
 # ===== Component-Specific Extractors =====
 
-def extract_python_version(repo_path: Path) -> str:
+def extract_python_version(ctx: ExtractionContext) -> str:
     """
     Extract Python version from Dockerfile.
     Note: This returns the build default (e.g., 3.12), not the RHEL-specific patch version.
     For RHEL builds, the actual version depends on the RHEL version (e.g., RHEL 9.6 uses 3.12.9).
     """
     # Try to get from Dockerfile first (gives us the build version like 3.12)
-    python_ver = parse_dockerfile_arg(repo_path, "Dockerfile", "PYTHON_VERSION")
+    python_ver = ctx.dockerfile_args("Dockerfile").get("PYTHON_VERSION")
     if python_ver:
         return python_ver
 
     # Fallback to pyproject.toml (gives us minimum supported version)
-    pyproject_path = repo_path / "pyproject.toml"
-    if not pyproject_path.exists():
+    content = ctx.read_text("pyproject.toml")
+    if content is None:
         return "[tbd]"
 
-    with open(pyproject_path, 'r') as f:
-        for line in f:
-            # Match: requires-python = ">=3.10,<3.14"
-            match = re.match(r'^\s*requires-python\s*=\s*">=(\d+\.\d+)', line.strip())
-            if match:
-                return match.group(1)
+    for line in content.splitlines():
+        # Match: requires-python = ">=3.10,<3.14"
+        match = _REQUIRES_PYTHON_RE.match(line.strip())
+        if match:
+            return match.group(1)
     return "[tbd]"
 
 
-def extract_cuda_version(repo_path: Path) -> str:
+def extract_cuda_version(ctx: ExtractionContext) -> str:
     """Extract CUDA version from Dockerfile."""
-    version = parse_dockerfile_arg(repo_path, "Dockerfile", "CUDA_VERSION")
+    version = ctx.dockerfile_args("Dockerfile").get("CUDA_VERSION")
     return version if version else "[tbd]"
 
 
-def extract_rocm_version(repo_path: Path) -> str:
+def extract_rocm_version(ctx: ExtractionContext) -> str:
     """Extract ROCM version from Dockerfile.rocm_base."""
-    base_image = parse_dockerfile_arg(repo_path, "Dockerfile.rocm_base", "BASE_IMAGE")
+    base_image = ctx.dockerfile_args("Dockerfile.rocm_base").get("BASE_IMAGE")
     if base_image:
         # Extract version from: rocm/dev-ubuntu-22.04:7.1-complete
-        match = re.search(r':(\d+\.\d+)', base_image)
+        match = _ROCM_TAG_RE.search(base_image)
         if match:
             return match.group(1)
     return "[tbd]"
 
 
-def extract_gcc_version(repo_path: Path) -> str:
+def extract_gcc_version(ctx: ExtractionContext) -> str:
     """Extract GCC version from Dockerfile."""
-    dockerfile_path = repo_path / "docker" / "Dockerfile"
-    if not dockerfile_path.exists():
+    content = ctx.read_text("docker/Dockerfile")
+    if content is None:
         return "[tbd]"
 
-    with open(dockerfile_path, 'r') as f:
-        content = f.read()
-        # Look for gcc-XX or g++-XX installation
-        match = re.search(r'gcc-(\d+)', content)
-        if match:
-            return match.group(1)
+    # Look for gcc-XX or g++-XX installation
+    match = _GCC_RE.search(content)
+    if match:
+        return match.group(1)
     return "[tbd]"
 
 
-def extract_aiter_version(repo_path: Path) -> str:
+def extract_aiter_version(ctx: ExtractionContext) -> str:
     """Extract aiter git hash from Dockerfile.rocm_base."""
-    aiter_branch = parse_dockerfile_arg(repo_path, "Dockerfile.rocm_base", "AITER_BRANCH")
+    aiter_branch = ctx.dockerfile_args("Dockerfile.rocm_base").get("AITER_BRANCH")
     if aiter_branch:
         # Return short form (8 chars) if it's a git hash
-        if re.match(r'^[0-9a-f]+$', aiter_branch):
+        if _is_hex(aiter_branch):
             return aiter_branch[:8]
         return aiter_branch
     return "[tbd]"
 
 
-def extract_torch_versions(repo_path: Path) -> Dict[str, str]:
+def extract_torch_versions(ctx: ExtractionContext) -> Dict[str, str]:
     """Extract torch versions for different accelerators."""
     versions = {}
 
     # CUDA
-    cuda_torch = parse_requirements_file(repo_path, "cuda.txt", "torch")
+    cuda_torch = ctx.requirements("cuda.txt").get("torch")
     versions['cuda'] = cuda_torch if cuda_torch else "[tbd]"
 
     # ROCM - try both rocm.txt and rocm-build.txt
-    rocm_torch = parse_requirements_file(repo_path, "rocm-build.txt", "torch")
+    rocm_torch = ctx.requirements("rocm-build.txt").get("torch")
     if not rocm_torch:
-        rocm_torch = parse_requirements_file(repo_path, "rocm.txt", "torch")
+        rocm_torch = ctx.requirements("rocm.txt").get("torch")
     versions['rocm'] = rocm_torch if rocm_torch else "[tbd]"
 
     # TPU
-    tpu_torch = parse_requirements_file(repo_path, "tpu.txt", "torch")
+    tpu_torch = ctx.requirements("tpu.txt").get("torch")
     if not tpu_torch:
         # TPU might not have torch in requirements if it's a plugin
         versions['tpu'] = "[TPU]"
@@ -251,131 +328,151 @@ def extract_torch_versions(repo_path: Path) -> Dict[str, str]:
     return versions
 
 
-def extract_common_packages(repo_path: Path) -> Dict[str, str]:
+def extract_common_packages(ctx: ExtractionContext) -> Dict[str, str]:
     """Extract versions for common packages from requirements/common.txt."""
     packages = {}
     common_pkgs = ['transformers', 'tokenizers', 'compressed-tensors']
 
     for pkg in common_pkgs:
-        version = parse_requirements_file(repo_path, "common.txt", pkg)
+        version = ctx.requirements("common.txt").get(pkg)
         packages[pkg] = version if version else "[tbd]"
 
     return packages
 
 
-def extract_flash_attn_version(repo_path: Path) -> str:
+def extract_flash_attn_version(ctx: ExtractionContext) -> str:
     """Extract flash_attn version from Dockerfile.rocm_base."""
-    fa_branch = parse_dockerfile_arg(repo_path, "Dockerfile.rocm_base", "FA_BRANCH")
+    fa_branch = ctx.dockerfile_args("Dockerfile.rocm_base").get("FA_BRANCH")
     if fa_branch:
         # Return short form (8 chars) if it's a git hash
-        if re.match(r'^[0-9a-f]+$', fa_branch):
+        if _is_hex(fa_branch):
             return fa_branch[:8]
         return fa_branch
     return "[tbd]"
 
 
-def extract_nccl_version(repo_path: Path) -> str:
+def extract_nccl_version(ctx: ExtractionContext) -> str:
     """Extract nccl version from requirements/test.txt."""
     # NCCL is installed as nvidia-nccl-cu12 package
-    nccl = parse_requirements_file(repo_path, "test.txt", "nvidia-nccl-cu12")
+    nccl = ctx.requirements("test.txt").get("nvidia-nccl-cu12")
     return nccl if nccl else "[tbd]"
 
 
-def extract_accelerator_packages(repo_path: Path) -> Dict[str, str]:
+def extract_accelerator_packages(ctx: ExtractionContext) -> Dict[str, str]:
     """Extract versions for accelerator-specific packages."""
     packages = {}
 
     # flashinfer from cuda.txt
-    flashinfer = parse_requirements_file(repo_path, "cuda.txt", "flashinfer-python")
+    flashinfer = ctx.requirements("cuda.txt").get("flashinfer-python")
     if not flashinfer:
-        flashinfer = parse_requirements_file(repo_path, "cuda.txt", "flashinfer")
+        flashinfer = ctx.requirements("cuda.txt").get("flashinfer")
     packages['flashinfer'] = flashinfer if flashinfer else "[tbd]"
 
     # triton - check multiple sources
-    triton = parse_requirements_file(repo_path, "rocm-build.txt", "triton")
+    triton = ctx.requirements("rocm-build.txt").get("triton")
     if not triton:
-        triton = parse_requirements_file(repo_path, "test.txt", "triton")
+        triton = ctx.requirements("test.txt").get("triton")
     packages['triton'] = triton if triton else "[tbd]"
 
     # tpu-info from tpu.txt
-    tpu_info = parse_requirements_file(repo_path, "tpu.txt", "tpu_info")
+    tpu_info = ctx.requirements("tpu.txt").get("tpu_info")
     if not tpu_info:
-        tpu_info = parse_requirements_file(repo_path, "tpu.txt", "tpu-info")
+        tpu_info = ctx.requirements("tpu.txt").get("tpu-info")
     packages['tpu-info'] = tpu_info if tpu_info else "[TPU]"
 
     return packages
 
 
-def extract_ep_kernel_versions(repo_path: Path) -> Dict[str, str]:
+def extract_ep_kernel_versions(ctx: ExtractionContext) -> Dict[str, str]:
     """Extract EP kernel component versions from install script."""
     versions = {}
     script_path = "tools/ep_kernels/install_python_libraries.sh"
 
     # PPLX kernels
-    pplx = parse_script_var(repo_path, script_path, "PPLX_COMMIT_HASH")
+    pplx = ctx.script_vars(script_path).get("PPLX_COMMIT_HASH")
     versions['pplx-kernels'] = pplx[:8] if pplx and len(pplx) >= 8 else (pplx if pplx else "[tbd]")
 
     # DeepEP
-    deepep = parse_script_var(repo_path, script_path, "DEEPEP_COMMIT_HASH")
+    deepep = ctx.script_vars(script_path).get("DEEPEP_COMMIT_HASH")
     versions['deep-ep'] = deepep[:8] if deepep and len(deepep) >= 8 else (deepep if deepep else "[tbd]")
 
     # NVSHMEM
-    nvshmem = parse_script_var(repo_path, script_path, "NVSHMEM_VER")
+    nvshmem = ctx.script_vars(script_path).get("NVSHMEM_VER")
     versions['nvshmem'] = nvshmem if nvshmem else "[tbd]"
 
     return versions
 
 
-def extract_deepgemm_version(repo_path: Path) -> str:
+def extract_deepgemm_version(ctx: ExtractionContext) -> str:
     """Extract DeepGEMM git hash from install script."""
-    deepgemm = parse_script_var(repo_path, "tools/install_deepgemm.sh", "DEEPGEMM_GIT_REF")
+    deepgemm = ctx.script_vars("tools/install_deepgemm.sh").get("DEEPGEMM_GIT_REF")
     if deepgemm:
         # Return short form (8 chars) if it's a git hash
-        if re.match(r'^[0-9a-f]+$', deepgemm) and len(deepgemm) >= 8:
+        if _is_hex_commit(deepgemm, min_len=8):
             return deepgemm[:8]
         return deepgemm
     return "[tbd]"
 
 
-def extract_nixl_version(repo_path: Path) -> str:
+def extract_nixl_version(ctx: ExtractionContext) -> str:
     """Extract nixl version from requirements files."""
     # Check tpu.txt first
-    nixl = parse_requirements_file(repo_path, "tpu.txt", "nixl")
+    nixl = ctx.requirements("tpu.txt").get("nixl")
     if nixl:
         return nixl
 
     # Check kv_connectors.txt
-    nixl = parse_requirements_file(repo_path, "kv_connectors.txt", "nixl")
+    nixl = ctx.requirements("kv_connectors.txt").get("nixl")
     if nixl:
         return nixl
 
     return "[tbd]"
 
 
-def extract_all_versions(repo_path: Path) -> List[Tuple[int, str, str]]:
+def extract_all_versions(ctx: ExtractionContext) -> List[Tuple[int, str, str]]:
     """
     Extract all component versions and return list of (row_num, component_name, version).
     Maintains exact spreadsheet order from row 16-43 with blank lines for merged cells.
     """
+    # The extractors are independent and mostly wait on git reads, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            func: executor.submit(safe_extract, func, ctx, default=default)
+            for func, default in [
+                (extract_python_version, "[tbd]"),
+                (extract_gcc_version, "[tbd]"),
+                (extract_cuda_version, "[tbd]"),
+                (extract_rocm_version, "[tbd]"),
+                (extract_torch_versions, {}),
+                (extract_aiter_version, "[tbd]"),
+                (extract_common_packages, {}),
+                (extract_accelerator_packages, {}),
+                (extract_flash_attn_version, "[tbd]"),
+                (extract_nccl_version, "[tbd]"),
+                (extract_ep_kernel_versions, {}),
+            ]
+        }
+    extracted = {func: future.result() for func, future in futures.items()}
+
     versions = []
 
     # Row 16: python
-    python_ver = safe_extract(extract_python_version, repo_path)
+    python_ver = extracted[extract_python_version]
     versions.append((16, "python", python_ver))
 
     # Row 17: RHEL
     versions.append((17, "RHEL", "[tbd]"))
 
     # Row 18: gcc [specific to Spyre]
-    gcc_ver = safe_extract(extract_gcc_version, repo_path)
+    gcc_ver = extracted[extract_gcc_version]
     versions.append((18, "gcc [specific to Spyre]", gcc_ver))
 
     # Row 19: CUDA
-    cuda_ver = safe_extract(extract_cuda_version, repo_path)
+    cuda_ver = extracted[extract_cuda_version]
     versions.append((19, "CUDA", cuda_ver))
 
     # Row 20: ROCM
-    rocm_ver = safe_extract(extract_rocm_version, repo_path)
+    rocm_ver = extracted[extract_rocm_version]
     versions.append((20, "ROCM", rocm_ver))
 
     # Rows 21-23: Spyre plugins
@@ -387,7 +484,7 @@ def extract_all_versions(repo_path: Path) -> List[Tuple[int, str, str]]:
     versions.append((24, "[merged cells]", ""))
 
     # Rows 25-28: torch variants
-    torch_vers = safe_extract(extract_torch_versions, repo_path, default={})
+    torch_vers = extracted[extract_torch_versions]
     versions.append((25, "torch [CUDA]", torch_vers.get('cuda', '[tbd]')))
     versions.append((26, "torch [ROCM]", torch_vers.get('rocm', '[tbd]')))
     versions.append((27, "torch [TPU]", torch_vers.get('tpu', '[TPU]')))
@@ -397,32 +494,32 @@ def extract_all_versions(repo_path: Path) -> List[Tuple[int, str, str]]:
     versions.append((29, "[merged cells]", ""))
 
     # Row 30: aiter [ROCM]
-    aiter_ver = safe_extract(extract_aiter_version, repo_path)
+    aiter_ver = extracted[extract_aiter_version]
     versions.append((30, "aiter [ROCM]", aiter_ver))
 
     # Common packages
-    common_pkgs = safe_extract(extract_common_packages, repo_path, default={})
+    common_pkgs = extracted[extract_common_packages]
 
     # Row 31: compressed-tensors
     versions.append((31, "compressed-tensors [CUDA, ROCM, TPU, Spyre]",
                     common_pkgs.get('compressed-tensors', '[tbd]')))
 
     # Accelerator-specific packages
-    accel_pkgs = safe_extract(extract_accelerator_packages, repo_path, default={})
+    accel_pkgs = extracted[extract_accelerator_packages]
 
     # Row 32: flashinfer [CUDA]
     versions.append((32, "flashinfer [CUDA]", accel_pkgs.get('flashinfer', '[tbd]')))
 
     # Row 33: flash_attn [ROCM]
-    flash_attn_ver = safe_extract(extract_flash_attn_version, repo_path)
+    flash_attn_ver = extracted[extract_flash_attn_version]
     versions.append((33, "flash_attn [ROCM]", flash_attn_ver))
 
     # Row 34: nccl
-    nccl_ver = safe_extract(extract_nccl_version, repo_path)
+    nccl_ver = extracted[extract_nccl_version]
     versions.append((34, "nccl", nccl_ver))
 
     # EP kernel versions
-    ep_vers = safe_extract(extract_ep_kernel_versions, repo_path, default={})
+    ep_vers = extracted[extract_ep_kernel_versions]
 
     # Row 35: nvshmem
     versions.append((35, "nvshmem", ep_vers.get('nvshmem', '[tbd]')))
@@ -454,6 +551,14 @@ def extract_all_versions(repo_path: Path) -> List[Tuple[int, str, str]]:
     return versions
 
 
+_VERSION_BUCKETS = {'[Spyre]': 'spyre', '[TPU]': 'tpu', '[tbd]': 'tbd', '': 'blank'}
+
+
+def _bucket(version: str) -> str:
+    """Classify a version value for the validation report summary."""
+    return _VERSION_BUCKETS.get(version, 'determined')
+
+
 def format_output(versions: List[Tuple[int, str, str]], show_labels: bool = False,
                  output_format: str = "simple") -> str:
     """
@@ -465,41 +570,35 @@ def format_output(versions: List[Tuple[int, str, str]], show_labels: bool = Fals
         output_format: "simple", "validation", or "csv"
     """
     # Sort by row number
-    sorted_versions = sorted(versions, key=lambda x: x[0])
+    sorted_versions = sorted(versions, key=operator.itemgetter(0))
 
     if output_format == "validation":
-        lines = []
-        lines.append("=" * 80)
-        lines.append("Component Version Extraction Report")
-        lines.append("=" * 80)
-        lines.append(f"{'Row':<5} {'Component':<45} {'Version':<20} {'Status':<10}")
-        lines.append("-" * 80)
-
+        buf = io.StringIO()
+        buf.write("=" * 80 + "\n")
+        buf.write("Component Version Extraction Report\n")
+        buf.write("=" * 80 + "\n")
+        buf.write(f"{'Row':<5} {'Component':<45} {'Version':<20} {'Status':<10}\n")
+        buf.write("-" * 80 + "\n")
+
+        # Table rows and summary statistics in a single pass (excluding merged cells)
+        counts = {'determined': 0, 'spyre': 0, 'tpu': 0, 'tbd': 0, 'blank': 0}
         for row, name, version in sorted_versions:
-            # Skip merged cells in the report
             if name == "[merged cells]":
                 continue
-            status = "✓" if version not in ['[tbd]', '[Spyre]', '[TPU]', ''] else "⚠"
-            lines.append(f"{row:<5} {name:<45} {version:<20} {status:<10}")
-
-        lines.append("=" * 80)
-
-        # Summary statistics (excluding merged cells)
-        components_only = [(r, n, v) for r, n, v in sorted_versions if n != "[merged cells]"]
-        total = len(components_only)
-        determined = sum(1 for _, _, v in components_only if v not in ['[tbd]', '[Spyre]', '[TPU]', ''])
-        spyre = sum(1 for _, _, v in components_only if v == '[Spyre]')
-        tpu = sum(1 for _, _, v in components_only if v == '[TPU]')
-        tbd = sum(1 for _, _, v in components_only if v == '[tbd]')
-
-        lines.append(f"Total components: {total}")
-        lines.append(f"Determined: {determined}")
-        lines.append(f"Spyre plugins: {spyre}")
-        lines.append(f"TPU plugins: {tpu}")
-        lines.append(f"TBD: {tbd}")
-        lines.append("=" * 80)
+            bucket = _bucket(version)
+            counts[bucket] += 1
+            status = "✓" if bucket == 'determined' else "⚠"
+            buf.write(f"{row:<5} {name:<45} {version:<20} {status:<10}\n")
 
-        return '\n'.join(lines)
+        buf.write("=" * 80 + "\n")
+        buf.write(f"Total components: {sum(counts.values())}\n")
+        buf.write(f"Determined: {counts['determined']}\n")
+        buf.write(f"Spyre plugins: {counts['spyre']}\n")
+        buf.write(f"TPU plugins: {counts['tpu']}\n")
+        buf.write(f"TBD: {counts['tbd']}\n")
+        buf.write("=" * 80)
+
+        return buf.getvalue()
 
     elif output_format == "csv":
         lines = []
@@ -533,6 +632,7 @@ Examples:
   %(prog)s --ref v0.11.2 --show-labels
   %(prog)s --ref main --output validation
   %(prog)s --ref v0.12.0 --repo-url https://github.com/vllm-project/vllm.git
+  %(prog)s --ref v0.11.2 v0.12.0 --output csv
 
 Output can be copy-pasted directly into the spreadsheet column for the specified release.
         """
@@ -541,8 +641,10 @@ Output can be copy-pasted directly into the spreadsheet column for the specified
     parser.add_argument(
         "--ref",
         type=str,
+        nargs="+",
         required=True,
-        help="vLLM git tag/ref to extract versions from (e.g., v0.12.0, main)"
+        help="vLLM git tag/ref(s) to extract versions from (e.g., v0.12.0, main). "
+             "Multiple refs may be space- or comma-separated and share one cached repo"
     )
 
     parser.add_argument(
@@ -567,29 +669,37 @@ Output can be copy-pasted directly into the spreadsheet column for the specified
 
     args = parser.parse_args()
 
-    # Clone repo in temp directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        try:
-            # Clone and checkout
-            repo_path = clone_vllm_repo(temp_path, args.repo_url, args.ref)
-
-            # Extract versions
-            print(f"Extracting component versions from {args.ref}...", file=sys.stderr)
-            versions = extract_all_versions(repo_path)
-
-            # Format and print output
-            output = format_output(versions, args.show_labels, args.output)
-            print(output)
+    refs = [ref for arg in args.ref for ref in arg.split(",") if ref]
+    if not refs:
+        parser.error("--ref needs at least one ref")
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error: Git operation failed: {e}", file=sys.stderr)
-            print(f"stderr: {e.stderr.decode() if e.stderr else 'N/A'}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
+    try:
+        # Fetch every ref into the cache before reading any of them
+        commits = []
+        for ref in refs:
+            cache_dir, commit = get_or_update_cache(args.repo_url, ref)
+            commits.append(commit)
+
+        # One cat-file process serves all refs
+        with GitBlobReader(cache_dir) as repo:
+            for ref, commit in zip(refs, commits):
+                # Extract versions
+                print(f"Extracting component versions from {ref}...", file=sys.stderr)
+                versions = extract_all_versions(ExtractionContext(repo, commit))
+
+                # Format and print output
+                output = format_output(versions, args.show_labels, args.output)
+                if len(refs) > 1:
+                    print(f"### ref={ref}")
+                print(output)
+
+    except subprocess.CalledProcessError as e:
+        print(f"Error: Git operation failed: {e}", file=sys.stderr)
+        print(f"stderr: {e.stderr.decode() if e.stderr else 'N/A'}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,17 @@ Generate JIRA CLI commands for creating package update tickets.
 Provides preview functionality and dry-run mode.
 """
 
-import yaml
 import os
+import shlex
+import atexit
 import subprocess
+import uuid
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import argparse
 
+from ticket_loader import load_tickets
+
 try:
     from rich.console import Console
     from rich.table import Table
@@ -23,6 +27,18 @@ except ImportError:
     console = None
 
 class JiraTicketGenerator:
+    # Body of the per-ticket details panel, filled in by preview_ticket_details
+    _PANEL_TMPL = (
+        "[bold cyan]Epic Title:[/bold cyan] {title}\n"
+        "[bold cyan]Package:[/bold cyan] {pkg_name}\n"
+        "[bold cyan]Old Version:[/bold cyan] {old_version}\n"
+        "[bold cyan]New Version:[/bold cyan] {new_version}\n"
+        "[bold cyan]Files:[/bold cyan] {files}\n"
+        "[bold cyan]Assignee:[/bold cyan] {assignee}\n"
+        "[bold cyan]Components:[/bold cyan] {components}\n"
+        "[bold cyan]Label:[/bold cyan] {label}"
+    )
+
     def __init__(self, ticket_dir: str, dry_run: bool = True):
         self.ticket_dir = Path(ticket_dir)
         self.dry_run = dry_run
@@ -30,28 +46,18 @@ class JiraTicketGenerator:
         self.project = "AIPCC"
         self.components = ["Accelerator Enablement", "Application Platform"]
         self.label = "package"
+        self.jira_image = "ghcr.io/ankitpokhrel/jira-cli:latest"
+        # Unique per run, so concurrent runs never touch each other's helper
+        self.helper_container = f"jira-helper-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.helper_running = False
     
     def load_ticket_files(self) -> List[Dict]:
         """Load all ticket YAML files."""
-        tickets = []
-        for yaml_file in self.ticket_dir.glob("*.yaml"):
-            with open(yaml_file, 'r') as f:
-                ticket_data = yaml.safe_load(f)
-                ticket_data['filename'] = yaml_file.name
-                tickets.append(ticket_data)
-        return sorted(tickets, key=lambda x: x['package_name'])
+        return list(load_tickets(str(self.ticket_dir)))
     
     def preview_tickets(self, tickets: List[Dict]):
         """Display a preview of all tickets to be created."""
-        console.print("\n[bold blue]📋 JIRA Ticket Preview[/bold blue]\n")
-        
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Package", style="cyan", width=20)
-        table.add_column("Old Version", style="yellow", width=15)
-        table.add_column("New Version", style="green", width=15)
-        table.add_column("Files", style="dim", width=30)
-        table.add_column("Change Type", style="blue", width=12)
-        
+        rows = []
         for ticket in tickets:
             old_ver = ticket['old_version'] or "N/A"
             new_ver = ticket['new_version'] or "N/A"
@@ -67,13 +73,29 @@ class JiraTicketGenerator:
             else:
                 change_type = "UPDATE"
             
-            table.add_row(
-                ticket['package_name'],
-                old_ver,
-                new_ver,
-                files,
-                change_type
-            )
+            rows.append((ticket['package_name'], old_ver, new_ver, files, change_type))
+        
+        # Piped output (files, CI logs) gets a plain table, skipping Rich's layout work
+        if not console.is_terminal:
+            print("\n📋 JIRA Ticket Preview\n")
+            print(f"{'Package':<25} {'Old Version':<15} {'New Version':<15} {'Change Type':<12} {'Files'}")
+            print("-" * 80)
+            for pkg_name, old_ver, new_ver, files, change_type in rows:
+                print(f"{pkg_name:<25} {old_ver:<15} {new_ver:<15} {change_type:<12} {files}")
+            print(f"\nTotal tickets to create: {len(tickets)}")
+            return
+        
+        console.print("\n[bold blue]📋 JIRA Ticket Preview[/bold blue]\n")
+        
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Package", style="cyan", width=20)
+        table.add_column("Old Version", style="yellow", width=15)
+        table.add_column("New Version", style="green", width=15)
+        table.add_column("Files", style="dim", width=30)
+        table.add_column("Change Type", style="blue", width=12)
+        
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         console.print(f"\n[bold]Total tickets to create: {len(tickets)}[/bold]")
@@ -86,14 +108,16 @@ class JiraTicketGenerator:
         title = f"builder: {pkg_name} package update request"
         
         console.print(Panel(
-            f"[bold cyan]Epic Title:[/bold cyan] {title}\n"
-            f"[bold cyan]Package:[/bold cyan] {pkg_name}\n"
-            f"[bold cyan]Old Version:[/bold cyan] {ticket['old_version'] or 'N/A'}\n"
-            f"[bold cyan]New Version:[/bold cyan] {ticket['new_version'] or 'N/A'}\n"
-            f"[bold cyan]Files:[/bold cyan] {', '.join(ticket['files'])}\n"
-            f"[bold cyan]Assignee:[/bold cyan] {self.assignee}\n"
-            f"[bold cyan]Components:[/bold cyan] {', '.join(self.components)}\n"
-            f"[bold cyan]Label:[/bold cyan] {self.label}",
+            self._PANEL_TMPL.format_map({
+                'title': title,
+                'pkg_name': pkg_name,
+                'old_version': ticket['old_version'] or 'N/A',
+                'new_version': ticket['new_version'] or 'N/A',
+                'files': ', '.join(ticket['files']),
+                'assignee': self.assignee,
+                'components': ', '.join(self.components),
+                'label': self.label,
+            }),
             title=f"📦 {pkg_name} Ticket Details",
             border_style="green"
         ))
@@ -110,54 +134,97 @@ class JiraTicketGenerator:
             border_style="yellow"
         ))
     
-    def generate_jira_commands(self, ticket: Dict) -> List[str]:
-        """Generate JIRA CLI commands for a single ticket."""
+    def jira_argv(self, *jira_args: str) -> List[str]:
+        """
+        argv that runs a jira-cli command.
+
+        While the helper container is running the command is a `docker exec` into it;
+        otherwise (e.g. in dry-run) it is a self-contained `docker run` that can be
+        copy-pasted as is.
+        """
+        if self.helper_running:
+            return ["docker", "exec", self.helper_container, "jira", *jira_args]
+        return [
+            "docker", "run", "--rm",
+            "-v", f"{os.getcwd()}/.jira-cli:/root/.config/.jira:Z",
+            "-e", "JIRA_API_TOKEN",  # passed through from the host environment
+            self.jira_image, "jira", *jira_args
+        ]
+
+    def start_helper_container(self):
+        """
+        Start one long-running jira-cli container for the whole batch.
+
+        Each command then runs via `docker exec`, instead of paying a full
+        `docker run` container startup per command.
+        """
+        subprocess.run([
+            "docker", "run", "-d", "--rm",
+            "--name", self.helper_container,
+            "-v", f"{os.getcwd()}/.jira-cli:/root/.config/.jira:Z",
+            "-e", "JIRA_API_TOKEN",  # passed through from the host environment
+            "--entrypoint", "sleep",
+            self.jira_image, "infinity"
+        ], check=True, capture_output=True, text=True)
+        self.helper_running = True
+        atexit.register(self.stop_helper_container)
+
+    def stop_helper_container(self):
+        """Remove the helper container started by start_helper_container."""
+        subprocess.run(["docker", "rm", "-f", self.helper_container], capture_output=True)
+        self.helper_running = False
+
+    def format_command(self, cmd: List[str]) -> str:
+        """Render an argv list as the shell command that runs exactly that argv."""
+        return shlex.join(cmd)
+
+    def generate_jira_commands(self, ticket: Dict) -> Iterator[List[str]]:
+        """
+        Generate JIRA CLI commands (as argv lists) for a single ticket.
+
+        Commands are yielded lazily, so each one is only built when the caller gets to it.
+        """
         pkg_name = ticket['package_name']
         title = f"builder: {pkg_name} package update request"
-        body = ticket['body_description'].replace('"', '\\"').replace('\n', '\\n')
-        
-        commands = []
+        body = ticket['body_description']
         
         # Create epic command
-        create_cmd = [
-            "docker", "run", "-it", "--rm",
-            "-v", "$PWD/.jira-cli:/root/.config/.jira:Z",
-            "-e", "JIRA_API_TOKEN=$JIRA_API_TOKEN",
-            "ghcr.io/ankitpokhrel/jira-cli:latest",
-            "jira", "epic", "create",
+        yield self.jira_argv(
+            "epic", "create",
             "-p", self.project,
-            "-n", f'"{title}"',
-            "-s", f'"{title}"',
-            "-b", f'"{body}"',
+            "-n", title,
+            "-s", title,
+            "-b", body,
             "--no-input"
-        ]
-        commands.append(" ".join(create_cmd))
+        )
         
         # Edit command (placeholder - we'll need the epic ID from the create command)
-        edit_cmd = [
-            "docker", "run", "-it", "--rm",
-            "-v", "$PWD/.jira-cli:/root/.config/.jira:Z", 
-            "-e", "JIRA_API_TOKEN=$JIRA_API_TOKEN",
-            "ghcr.io/ankitpokhrel/jira-cli:latest",
-            "jira", "issue", "edit", "<EPIC_ID>",
-            "-s", f'"{title}"',
+        edit_cmd = self.jira_argv(
+            "issue", "edit", "<EPIC_ID>",
+            "-s", title,
             "-y", "Normal",
             "-a", self.assignee,
             "-l", self.label
-        ]
+        )
         
         # Add components
         for component in self.components:
-            edit_cmd.extend(["-C", f'"{component}"'])
+            edit_cmd.extend(["-C", component])
         
-        commands.append(" ".join(edit_cmd))
-        
-        return commands
+        yield edit_cmd
     
     def run_tickets(self, tickets: List[Dict], interactive: bool = True):
         """Run JIRA commands for all tickets."""
         if self.dry_run:
             console.print("[bold yellow]🔍 DRY RUN MODE - Commands will be displayed but not executed[/bold yellow]\n")
+        else:
+            try:
+                self.start_helper_container()
+            except (OSError, subprocess.CalledProcessError) as e:
+                console.print(f"[red]Could not start {self.helper_container} container: {e}[/red]")
+                if getattr(e, 'stderr', None):
+                    console.print(e.stderr)
+                return
         
         for i, ticket in enumerate(tickets, 1):
             pkg_name = ticket['package_name']
@@ -176,13 +243,12 @@ class JiraTicketGenerator:
     def process_single_ticket(self, ticket: Dict):
         """Process a single ticket."""
         pkg_name = ticket['package_name']
-        commands = self.generate_jira_commands(ticket)
-        
         console.print(f"\n[bold green]Commands for {pkg_name}:[/bold green]")
         
-        for i, cmd in enumerate(commands, 1):
+        for i, cmd in enumerate(self.generate_jira_commands(ticket), 1):
             console.print(f"\n[dim]Command {i}:[/dim]")
-            console.print(Panel(cmd, border_style="dim"))
+            # Text, so brackets in the body are not taken for rich markup
+            console.print(Panel(Text(self.format_command(cmd)), border_style="dim"))
             
             if not self.dry_run:
                 if console.input(f"Execute command {i}? [Y/n]: ").lower().startswith('n'):
@@ -191,7 +257,7 @@ class JiraTicketGenerator:
                 
                 # Execute the command
                 try:
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                    result = subprocess.run(cmd, capture_output=True, text=True)
                     if result.returncode == 0:
                         console.print(f"[green]✓ Command executed successfully[/green]")
                         console.print(result.stdout)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Shared reading of files from git objects, without a checkout.
+Used by both generate_component_versions.py and parse_diff.py.
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+# Fail instead of hanging on a credential prompt when the remote needs auth
+GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+class GitBlobReaderError(RuntimeError):
+    """The cat-file process failed, so a read cannot tell whether the file exists."""
+
+
+class GitBlobReader:
+    """
+    Read files straight out of a git repository's objects without checking anything out.
+
+    One long-lived `git cat-file --batch` process serves every read, so any number of
+    files costs a single fork and no working-tree writes. Works on bare repositories
+    and on clones without a working tree alike.
+    """
+
+    def __init__(self, git_dir: Path):
+        self.git_dir = git_dir
+        # stderr goes to a file rather than a pipe so it can never fill up and stall git
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen([
+            "git", "-C", str(git_dir), "cat-file", "--batch"
+        ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=self._stderr,
+            env=GIT_ENV, bufsize=1 << 20)
+        # Requests and responses on the pipe must not interleave across threads
+        self._lock = threading.Lock()
+
+    def read(self, ref: str, path: str) -> Optional[bytes]:
+        """
+        Return the contents of path at ref, or None if it does not exist.
+
+        Raises GitBlobReaderError if cat-file died or answered with anything other than
+        an object or "missing" (e.g. a lazy fetch of the blob failed).
+        """
+        with self._lock:
+            try:
+                self._proc.stdin.write(f"{ref}:{path}\n".encode())
+                self._proc.stdin.flush()
+            except BrokenPipeError:
+                raise self._failure(f"{ref}:{path}") from None
+
+            # Header is "<sha> <type> <size>", or "<object> missing" when not found
+            header = self._proc.stdout.readline().rstrip(b"\n")
+            if not header or self._proc.poll() is not None:
+                raise self._failure(f"{ref}:{path}")
+            if header.endswith(b" missing"):
+                return None
+            # Split the size off the right, as the object name may contain spaces
+            info, size = header.rsplit(None, 1)
+            obj_type = info.rsplit(None, 1)[-1]
+            if not size.isdigit():
+                raise self._failure(f"{ref}:{path}", header.decode(errors="replace"))
+
+            data = self._proc.stdout.read(int(size))
+            if len(data) != int(size):
+                raise self._failure(f"{ref}:{path}")
+            self._proc.stdout.read(1)  # trailing LF
+        return data if obj_type == b"blob" else None
+
+    def _failure(self, obj: str, detail: str = "") -> GitBlobReaderError:
+        """Build the error for a failed read of obj, including what git wrote to stderr."""
+        if not detail:
+            self._stderr.seek(0)
+            detail = self._stderr.read().decode(errors="replace").strip()
+            detail = detail or f"git cat-file exited with status {self._proc.wait()}"
+        return GitBlobReaderError(f"Could not read {obj} from {self.git_dir}: {detail}")
+
+    def read_text(self, ref: str, path: str) -> Optional[str]:
+        """Return the decoded contents of path at ref, or None if it does not exist."""
+        data = self.read(ref, path)
+        return data.decode() if data is not None else None
+
+    def close(self):
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass  # Already dead; the read that noticed has raised
+        self._proc.wait()
+        self._stderr.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
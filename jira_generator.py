@@ -4,30 +4,40 @@ Generate JIRA CLI commands for creating package update tickets.
 Provides preview functionality and dry-run mode.
 """
 
-import yaml
+import json
 import os
+import re
 import subprocess
 import time
-import argparse
+import urllib.error
+import urllib.request
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import argparse
 
+from ticket_loader import load_tickets
+
+# How throttling shows up in rhjira output. Only HTTP-status context counts: a bare
+# 429 also appears in issue keys (AIPCC-429) and traceback line numbers, and
+# retrying on those could clone duplicate epics.
+_RATE_LIMITED_RE = re.compile(
+    r'\bHTTP(?:/[\d.]+)?\s+429\b|\bstatus(?:[ _]code)?\s*[:=]?\s*429\b|Too Many Requests',
+    re.IGNORECASE
+)
+_RETRY_AFTER_RE = re.compile(r'Retry-After:?\s*(\d+)', re.IGNORECASE)
+
 class JiraTicketGenerator:
     def __init__(self, ticket_dir: str, dry_run: bool = True):
         self.ticket_dir = Path(ticket_dir)
         self.dry_run = dry_run
         self.template_epic = "AIPCC-1"  # Template epic to clone from
+        self.jira_url = "https://issues.redhat.com"
+        self.bulk_chunk_size = 50  # Maximum issues per /issue/bulk request
+        self.max_retries = 5  # Retries per request when JIRA answers 429
     
     def load_ticket_files(self) -> List[Dict]:
         """Load all ticket YAML files."""
-        tickets = []
-        for yaml_file in self.ticket_dir.glob("*.yaml"):
-            with open(yaml_file, 'r') as f:
-                ticket_data = yaml.safe_load(f)
-                ticket_data['filename'] = yaml_file.name
-                tickets.append(ticket_data)
-        return sorted(tickets, key=lambda x: x['package_name'])
+        return list(load_tickets(str(self.ticket_dir)))
     
     def preview_tickets(self, tickets: List[Dict]):
         """Display a preview of all tickets to be created."""
@@ -86,6 +96,33 @@ class JiraTicketGenerator:
         print(preview_body)
         print(f"{'='*60}")
     
+    def retry_delay(self, retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait after a 429: the server's Retry-After, else exponential backoff."""
+        if retry_after and retry_after.strip().isdigit():
+            return int(retry_after)
+        return 2 ** attempt
+
+    def run_rhjira(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Run an rhjira command, sleeping and retrying only when JIRA rate limits it.
+
+        Raises subprocess.CalledProcessError for any other failure, like check=True.
+        """
+        for attempt in range(self.max_retries + 1):
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                return result
+
+            output = f"{result.stdout}\n{result.stderr}"
+            if attempt < self.max_retries and _RATE_LIMITED_RE.search(output):
+                retry_after = _RETRY_AFTER_RE.search(output)
+                delay = self.retry_delay(retry_after.group(1) if retry_after else None, attempt)
+                print(f"⏳ Rate limited by JIRA, retrying in {delay}s...")
+                time.sleep(delay)
+                continue
+
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
     def create_jira_ticket(self, ticket: Dict) -> str:
         """Create a JIRA ticket using rhjira tool."""
         pkg_name = ticket['package_name']
@@ -101,12 +138,7 @@ class JiraTicketGenerator:
         try:
             # Step 1: Clone the template epic
             print(f"🔄 Cloning {self.template_epic} for {pkg_name}...")
-            clone_result = subprocess.run(
-                ["rhjira", "clone", self.template_epic],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            clone_result = self.run_rhjira(["rhjira", "clone", self.template_epic])
             
             # Extract the new epic ID from the output
             # Expected format: "Successfully created: https://issues.redhat.com/browse/AIPCC-XXXX"
@@ -124,13 +156,13 @@ class JiraTicketGenerator:
             
             # Step 2: Update the epic with our details
             print(f"📝 Updating epic {epic_id} with package details...")
-            edit_result = subprocess.run([
+            edit_result = self.run_rhjira([
                 "rhjira", "edit", epic_id,
                 "--epicname", epic_name,
                 "--summary", epic_name,
                 "--description", description,
                 "--noeditor"
-            ], capture_output=True, text=True, check=True)
+            ])
             
             print(f"✅ Successfully updated epic: {epic_id}")
             print(f"🔗 URL: {epic_url}")
@@ -147,10 +179,125 @@ class JiraTicketGenerator:
             print(f"❌ Unexpected error creating ticket for {pkg_name}: {e}")
             return None
 
+    def jira_request(self, method: str, path: str, payload: Dict = None) -> Dict:
+        """Send a JSON request to the JIRA REST API, authenticated with $JIRA_TOKEN."""
+        request = urllib.request.Request(
+            f"{self.jira_url}{path}",
+            data=json.dumps(payload).encode() if payload is not None else None,
+            method=method,
+            headers={
+                "Authorization": f"Bearer {os.environ['JIRA_TOKEN']}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        )
+        for attempt in range(self.max_retries + 1):
+            try:
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    return json.load(response)
+            except urllib.error.HTTPError as e:
+                # Only back off when the server actually throttles us
+                if e.code != 429 or attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay(e.headers.get('Retry-After'), attempt)
+                print(f"⏳ Rate limited by JIRA, retrying in {delay}s...")
+                time.sleep(delay)
+
+    def template_fields(self) -> Tuple[Dict, Optional[str]]:
+        """
+        Fetch the template epic once and return (fields to copy, Epic Name field id).
+
+        Copying project, issue type, components, labels, assignee and priority onto
+        every new epic gives the same result as `rhjira clone` of the template.
+        """
+        template = self.jira_request("GET", f"/rest/api/2/issue/{self.template_epic}?expand=names")
+        fields = {}
+        for name in ("project", "issuetype", "components", "labels", "assignee", "priority"):
+            value = template['fields'].get(name)
+            if not value:
+                continue
+            if name == "assignee":
+                fields[name] = {"name": value["name"]}
+            elif name == "components":
+                fields[name] = [{"id": component["id"]} for component in value]
+            elif isinstance(value, dict):
+                fields[name] = {"id": value["id"]}
+            else:
+                fields[name] = value
+        epic_name_field = next(
+            (field_id for field_id, field_name in template.get('names', {}).items()
+             if field_name == "Epic Name"),
+            None
+        )
+        return fields, epic_name_field
+
+    def bulk_create(self, tickets: List[Dict]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Create epics for all tickets through /rest/api/2/issue/bulk, 50 per request.
+
+        Returns ({package_name: epic_id} for the epics that were created, package names
+        whose outcome is unknown). Tickets in neither were provably not created and
+        should be retried through create_jira_ticket; the unknown ones must not be, as
+        the server may have created them before the request failed.
+        """
+        if not os.environ.get('JIRA_TOKEN'):
+            print("⚠️  JIRA_TOKEN is not set, skipping bulk creation")
+            return {}, []
+
+        try:
+            base_fields, epic_name_field = self.template_fields()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️  Could not read template epic {self.template_epic}, skipping bulk creation: {e}")
+            return {}, []
+
+        created = {}
+        unknown = []
+        for start in range(0, len(tickets), self.bulk_chunk_size):
+            chunk = tickets[start:start + self.bulk_chunk_size]
+            issue_updates = []
+            for ticket in chunk:
+                epic_name = f"builder: {ticket['package_name']} package update request"
+                fields = dict(base_fields, summary=epic_name, description=ticket['body_description'])
+                if epic_name_field:
+                    fields[epic_name_field] = epic_name
+                issue_updates.append({"fields": fields})
+
+            print(f"🔄 Bulk creating {len(chunk)} epics...")
+            try:
+                result = self.jira_request("POST", "/rest/api/2/issue/bulk", {"issueUpdates": issue_updates})
+            except urllib.error.HTTPError as e:
+                # A 4xx is a rejection of the request, so nothing in it was created
+                print(f"❌ Bulk request failed: {e}")
+                if not 400 <= e.code < 500:
+                    unknown.extend(ticket['package_name'] for ticket in chunk)
+                continue
+            except (OSError, ValueError) as e:
+                # Timeouts, resets and unreadable responses may follow a committed create
+                print(f"❌ Bulk request failed: {e}")
+                unknown.extend(ticket['package_name'] for ticket in chunk)
+                continue
+
+            # "issues" lists the successes in request order, skipping failed elements
+            failed = {error.get('failedElementNumber') for error in result.get('errors', [])}
+            issues = iter(result.get('issues', []))
+            for index, ticket in enumerate(chunk):
+                if index in failed:
+                    continue
+                issue = next(issues, None)
+                if issue is None:
+                    # Neither created nor reported as failed, so its outcome is unclear
+                    unknown.extend(
+                        t['package_name'] for i, t in enumerate(chunk)
+                        if i >= index and i not in failed
+                    )
+                    break
+                created[ticket['package_name']] = issue['key']
+                print(f"🔗 URL: {self.jira_url}/browse/{issue['key']}")
+
+        return created, unknown
 
-    
     def run_tickets(self, tickets: List[Dict], interactive: bool = True):
-        """Run JIRA ticket creation directly using rhjira."""
+        """Run JIRA ticket creation, in bulk via the REST API with rhjira as fallback."""
         if self.dry_run:
             print("🔍 DRY RUN MODE - No actual tickets will be created\n")
         
@@ -163,6 +310,18 @@ class JiraTicketGenerator:
         
         created_tickets = []
         failed_tickets = []
+        selected_tickets = []
+
+        def record(pkg_name: str, epic_id: Optional[str]):
+            if epic_id:
+                created_tickets.append({
+                    'package': pkg_name,
+                    'epic_id': epic_id
+                })
+                print(f"✅ Successfully created {epic_id} for {pkg_name}")
+            else:
+                failed_tickets.append(pkg_name)
+                print(f"❌ Failed to create ticket for {pkg_name}")
         
         for i, ticket in enumerate(tickets, 1):
             pkg_name = ticket['package_name']
@@ -176,21 +335,29 @@ class JiraTicketGenerator:
                     print(f"⏭️  Skipped {pkg_name}")
                     continue
             
-            epic_id = self.create_jira_ticket(ticket)
-            
-            if epic_id:
-                created_tickets.append({
-                    'package': pkg_name,
-                    'epic_id': epic_id
-                })
-                print(f"✅ Successfully created {epic_id} for {pkg_name}")
+            if self.dry_run:
+                record(pkg_name, self.create_jira_ticket(ticket))
             else:
-                failed_tickets.append(pkg_name)
-                print(f"❌ Failed to create ticket for {pkg_name}")
-            
-            # Add a small delay between requests to be nice to the server
-            if not self.dry_run and i < len(tickets):
-                time.sleep(1)
+                selected_tickets.append(ticket)
+
+        if selected_tickets:
+            bulk_created, bulk_unknown = self.bulk_create(selected_tickets)
+            bulk_unknown = set(bulk_unknown)
+            fallback_tickets = []
+            for ticket in selected_tickets:
+                pkg_name = ticket['package_name']
+                epic_id = bulk_created.get(pkg_name)
+                if epic_id:
+                    record(pkg_name, epic_id)
+                elif pkg_name in bulk_unknown:
+                    print(f"⚠️  Outcome unknown for {pkg_name}, check JIRA before re-running")
+                    record(pkg_name, None)
+                else:
+                    fallback_tickets.append(ticket)
+
+            # Anything the bulk endpoint did not create goes through rhjira one by one
+            for ticket in fallback_tickets:
+                record(ticket['package_name'], self.create_jira_ticket(ticket))
         
         # Summary
         print(f"\n{'='*60}")
@@ -3,117 +3,149 @@
 Parse vLLM requirements diff to extract package changes for JIRA ticket generation.
 """
 
+import difflib
+import io
+import os
 import re
 import yaml
 import subprocess
-import tempfile
-import shutil
+import sys
 import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
-
-def clone_vllm_repo(temp_dir: Path) -> Path:
-    """Clone the vLLM repository to a temporary directory."""
-    vllm_path = temp_dir / "vllm"
-    print("Cloning vLLM repository...")
-    subprocess.run([
-        "git", "clone", "https://github.com/vllm-project/vllm.git", str(vllm_path)
-    ], check=True, capture_output=True)
-    return vllm_path
-
-def filter_requirements_files(requirements_dir: Path) -> List[Path]:
-    """Filter requirements files to only include the ones we care about."""
-    # Include: common, build, cuda, rocm, tpu
-    # Exclude: test*, nightly*, cpu*
-    include_patterns = ["common", "build", "cuda", "rocm", "tpu"]
-    exclude_patterns = ["test", "nightly", "cpu"]
-    
-    filtered_files = []
-    
+from typing import Dict, Iterable, List, Optional, Tuple, Set
+
+from git_blob_reader import GitBlobReader
+from repo_cache import get_or_update_cache
+
+# Prefer the LibYAML C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+# Patterns for parse_package_line, which runs on every diff line.
+# _PKG_RE classifies a URL-based package ("name @ http...") or a standard
+# specification in one pass; the others pull the version out afterwards.
+_PKG_RE = re.compile(
+    r'^(?=.*http)(?P<url_name>[^\s\[]+)(?:\[[^\]]+\])?\s*@'
+    r'|^(?P<name>[a-zA-Z0-9_-]+)(?:\[[^\]]+\])?\s*'
+    r'(?P<spec>[><=!]+\s*[\d\.\w\+]+(?:\s*,\s*[><=!]+\s*[\d\.\w\+]+)*)?'
+)
+_GIT_COMMIT_RE = re.compile(r'@([0-9a-f]{40})')
+_URL_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+(?:\.dev\d+)?)')
+_LOWER_BOUND_RE = re.compile(r'>=?\s*(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)')
+_EXACT_RE = re.compile(r'==\s*(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)')
+_UPPER_BOUND_RE = re.compile(r'^\s*<[=]?\s*[\d\.]+')
+_VERSION_RE = re.compile(r'(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)')
+
+# Requirements files we care about, by lowercased stem.
+# Include: common, build, cuda, rocm, tpu, and a base requirements.txt/.in
+# Exclude: test*, nightly*, cpu*
+_KEEP_RE = re.compile(
+    r'(?!.*(?:test|nightly|cpu))(?:.*(?:common|build|cuda|rocm|tpu)|requirements\Z)',
+    re.DOTALL
+)
+
+# Names that parse as packages but are not (e.g. pip-compile "# via" annotations)
+_SKIP_PKG_NAMES = frozenset(('', 'via'))
+
+@lru_cache(maxsize=None)
+def is_wanted_requirements_file(filename: str) -> bool:
+    """Check whether a requirements file name is one we care about."""
     # Check both .txt and .in files
-    for pattern in ["*.txt", "*.in"]:
-        for req_file in requirements_dir.glob(pattern):
-            filename = req_file.stem.lower()
-            
-            # Check if it matches any exclude pattern
-            should_exclude = any(exclude in filename for exclude in exclude_patterns)
-            if should_exclude:
-                continue
-                
-            # Check if it matches any include pattern or is a base requirements file
-            should_include = (
-                any(include in filename for include in include_patterns) or
-                filename == "requirements"  # Include base requirements.txt/.in if it exists
-            )
-            
-            if should_include:
-                filtered_files.append(req_file)
-    
-    return filtered_files
+    stem, dot, suffix = filename.rpartition('.')
+    if not dot or suffix not in ("txt", "in"):
+        return False
+    return _KEEP_RE.match(stem.lower()) is not None
+
+def requirements_tree(repo_path: Path, commit: str) -> Optional[str]:
+    """Return the object id of commit's requirements/ tree, or None if it has none."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{commit}:requirements"],
+        cwd=repo_path, capture_output=True
+    )
+    return result.stdout.strip().decode() if result.returncode == 0 else None
+
+def read_requirements_files(repo: GitBlobReader, commit: str) -> Dict[str, str]:
+    """Read the filtered requirements files of commit straight from git, without a checkout."""
+    listing = subprocess.run(
+        ["git", "ls-tree", "--name-only", commit, "requirements/"],
+        cwd=repo.git_dir, check=True, capture_output=True
+    ).stdout.decode()
+
+    # Every blob of this ref comes through the cat-file --batch process behind repo
+    files = {}
+    for path in listing.splitlines():
+        name = path.rpartition('/')[2]
+        if is_wanted_requirements_file(name):
+            content = repo.read_text(commit, path)
+            if content is not None:
+                files[name] = content
+    return files
+
+def generate_requirements_diff(repo_url: str, old_ref: str, new_ref: str) -> str:
+    """
+    Generate a diff between requirements directories for two git refs.
+
+    Only the two refs are fetched, shallow and treeless, into the persistent cache
+    shared with generate_component_versions.py; the blobs that are read come on demand.
+    The filtered files of both refs are compared in memory with difflib, producing the
+    same shape of output as "diff -ru": one unified diff per file present in both refs
+    and an "Only in" line for files present in just one of them.
+    """
+    repo_path, old_commit = get_or_update_cache(repo_url, old_ref)
+    _, new_commit = get_or_update_cache(repo_url, new_ref)
 
-def generate_requirements_diff(repo_path: Path, old_ref: str, new_ref: str) -> str:
-    """Generate a diff between requirements directories for two git refs."""
     print(f"Generating diff between {old_ref} and {new_ref}...")
-    
-    # Create temporary directories for each version
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        old_req_dir = temp_path / "old_requirements"
-        new_req_dir = temp_path / "new_requirements"
-        
-        # Checkout old version and copy filtered requirements
-        subprocess.run(["git", "checkout", old_ref], 
-                      cwd=repo_path, check=True, capture_output=True)
-        
-        old_req_source = repo_path / "requirements"
-        if old_req_source.exists():
-            shutil.copytree(old_req_source, old_req_dir)
-            # Filter to only the files we care about
-            old_filtered = filter_requirements_files(old_req_dir)
-            # Remove files we don't want (both .txt and .in)
-            for pattern in ["*.txt", "*.in"]:
-                for req_file in old_req_dir.glob(pattern):
-                    if req_file not in old_filtered:
-                        req_file.unlink()
-        else:
-            old_req_dir.mkdir()
-        
-        # Checkout new version and copy filtered requirements
-        subprocess.run(["git", "checkout", new_ref], 
-                      cwd=repo_path, check=True, capture_output=True)
-        
-        new_req_source = repo_path / "requirements"
-        if new_req_source.exists():
-            shutil.copytree(new_req_source, new_req_dir)
-            # Filter to only the files we care about
-            new_filtered = filter_requirements_files(new_req_dir)
-            # Remove files we don't want (both .txt and .in)
-            for pattern in ["*.txt", "*.in"]:
-                for req_file in new_req_dir.glob(pattern):
-                    if req_file not in new_filtered:
-                        req_file.unlink()
-        else:
-            new_req_dir.mkdir()
-        
-        # Generate diff
-        try:
-            result = subprocess.run([
-                "diff", "-ru", str(old_req_dir), str(new_req_dir)
-            ], capture_output=True, text=True)
-            
-            # diff returns 1 when there are differences, which is expected
-            if result.returncode in [0, 1]:
-                return result.stdout
-            else:
-                print(f"Warning: diff command returned code {result.returncode}")
-                print(f"stderr: {result.stderr}")
-                return result.stdout
-        except subprocess.CalledProcessError as e:
-            print(f"Error running diff: {e}")
-            return ""
 
+    # Identical tree ids mean nothing under requirements/ changed at all
+    old_tree = requirements_tree(repo_path, old_commit)
+    if old_tree is not None and old_tree == requirements_tree(repo_path, new_commit):
+        print("requirements/ tree unchanged")
+        return ""
+
+    def read_commit(commit: str) -> Dict[str, str]:
+        # One cat-file process per ref, so both refs are read concurrently
+        with GitBlobReader(repo_path) as repo:
+            return read_requirements_files(repo, commit)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        old_future = executor.submit(read_commit, old_commit)
+        new_future = executor.submit(read_commit, new_commit)
+        old_files, new_files = old_future.result(), new_future.result()
+    old_dir = f"{old_ref}/requirements"
+    new_dir = f"{new_ref}/requirements"
+
+    diff = io.StringIO()
+    for name in sorted(old_files.keys() | new_files.keys()):
+        if name not in new_files:
+            diff.write(f"Only in {old_dir}: {name}\n")
+        elif name not in old_files:
+            diff.write(f"Only in {new_dir}: {name}\n")
+        elif old_files[name] != new_files[name]:
+            # Keep every line newline-terminated so hunks concatenate cleanly
+            old_lines = [line + '\n' for line in old_files[name].splitlines()]
+            new_lines = [line + '\n' for line in new_files[name].splitlines()]
+            # Same set of lines (only reordered or duplicated): no requirement changed,
+            # so skip the LCS diff entirely
+            if set(old_lines) == set(new_lines):
+                continue
+            diff.write(f"diff -ru {old_dir}/{name} {new_dir}/{name}\n")
+            diff.writelines(difflib.unified_diff(
+                old_lines, new_lines, f"{old_dir}/{name}", f"{new_dir}/{name}"
+            ))
+    return diff.getvalue()
+
+@lru_cache(maxsize=4096)
 def parse_package_line(line: str) -> Tuple[str, str]:
-    """Extract package name and version from a requirement line."""
+    """
+    Extract package name and version from a requirement line.
+
+    Memoized: the same requirement line often appears in several requirements files.
+    """
     # Handle various package formats
     line = line.strip()
 
@@ -121,105 +153,132 @@ def parse_package_line(line: str) -> Tuple[str, str]:
     if not line or line.startswith('#') or line.startswith('--'):
         return None, None
     
-    # Handle URL-based packages (torch_xla, git repos)
-    if '@' in line and 'http' in line:
-        # Extract package name before @
-        match = re.match(r'^([^\s\[]+)(?:\[[^\]]+\])?\s*@', line)
-        if match:
-            pkg_name = match.group(1)
-
-            # First try to extract git commit hash (40 hex characters)
-            git_commit_match = re.search(r'@([0-9a-f]{40})', line)
-            if git_commit_match:
-                # Use short form (first 8 characters) for readability
-                version = git_commit_match.group(1)[:8]
-                return pkg_name, version
-
-            # Otherwise extract semantic version from URL
-            version_match = re.search(r'(\d+\.\d+\.\d+(?:\.dev\d+)?)', line)
-            version = version_match.group(1) if version_match else "unknown"
+    # One match classifies the line: the first alternative is a URL-based package
+    # ("name @ http..." - torch_xla, git repos), the second a standard specification
+    # (package name, optional extras and version spec)
+    match = _PKG_RE.match(line)
+    if not match:
+        return None, None
+
+    pkg_name = match.group('url_name')
+    if pkg_name:
+        # First try to extract git commit hash (40 hex characters)
+        git_commit_match = _GIT_COMMIT_RE.search(line)
+        if git_commit_match:
+            # Use short form (first 8 characters) for readability
+            version = git_commit_match.group(1)[:8]
             return pkg_name, version
-    
-    # Handle standard package specifications
-    # Match package name, optional extras, and version spec
-    match = re.match(r'^([a-zA-Z0-9_-]+)(?:\[[^\]]+\])?\s*([><=!]+\s*[\d\.\w\+]+(?:\s*,\s*[><=!]+\s*[\d\.\w\+]+)*)?', line)
-    if match:
-        pkg_name = match.group(1)
-        version_spec = match.group(2) if match.group(2) else ""
-
-        # Extract version numbers from version spec
-        if version_spec:
-            # Prefer lower bounds (>=) over upper bounds (<) for version constraints
-            # This handles cases like ">=0.1.9,<1.0.0" correctly
-            lower_bound_match = re.search(r'>=?\s*(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)', version_spec)
-            if lower_bound_match:
-                version = lower_bound_match.group(1)
+
+        # Otherwise extract semantic version from URL
+        version_match = _URL_VERSION_RE.search(line)
+        version = version_match.group(1) if version_match else "unknown"
+        return pkg_name, version
+
+    pkg_name = match.group('name')
+    version_spec = match.group('spec') or ""
+
+    # Extract version numbers from version spec
+    if version_spec:
+        # Prefer lower bounds (>=) over upper bounds (<) for version constraints
+        # This handles cases like ">=0.1.9,<1.0.0" correctly
+        lower_bound_match = _LOWER_BOUND_RE.search(version_spec)
+        if lower_bound_match:
+            version = lower_bound_match.group(1)
+        else:
+            # If no lower bound, try exact version (==)
+            exact_match = _EXACT_RE.search(version_spec)
+            if exact_match:
+                version = exact_match.group(1)
             else:
-                # If no lower bound, try exact version (==)
-                exact_match = re.search(r'==\s*(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)', version_spec)
-                if exact_match:
-                    version = exact_match.group(1)
+                # Check if it's only an upper bound constraint (< or <=)
+                # In this case, keep the full constraint since there's no specific version
+                if _UPPER_BOUND_RE.match(version_spec.strip()):
+                    version = version_spec.strip()
                 else:
-                    # Check if it's only an upper bound constraint (< or <=)
-                    # In this case, keep the full constraint since there's no specific version
-                    if re.match(r'^\s*<[=]?\s*[\d\.]+', version_spec.strip()):
-                        version = version_spec.strip()
-                    else:
-                        # Fall back to any version number found
-                        version_match = re.search(r'(\d+\.\d+(?:\.\d+)?(?:\+\w+|\.dev\d+)?)', version_spec)
-                        version = version_match.group(1) if version_match else version_spec.strip()
-        else:
-            version = "latest"
+                    # Fall back to any version number found
+                    version_match = _VERSION_RE.search(version_spec)
+                    version = version_match.group(1) if version_match else version_spec.strip()
+    else:
+        version = "latest"
 
-        return pkg_name, version
-    
-    return None, None
+    return pkg_name, version
+
+@lru_cache(maxsize=256)
+def _diff_file_name(file_path: str) -> str:
+    """
+    Name of the file in a "--- path" / "+++ path" diff header.
 
-def extract_changes_from_diff(diff_content: str) -> Dict[str, Dict]:
-    """Extract package changes from the diff content."""
-    changes = {}
+    Basename without the trailing timestamp; (r)partition avoids list allocation. The
+    result is interned, so every package's files entries share one string per file.
+    """
+    return sys.intern(file_path.rpartition('/')[2].partition('\t')[0])
+
+def extract_changes_from_diff(diff_lines: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Extract package changes from the diff content.
+
+    diff_lines is any iterable of lines (an open file, io.StringIO, ...) and is consumed
+    lazily, so the whole diff never has to be held as a list of lines.
+    """
+    changes = defaultdict(lambda: {'old_version': None, 'new_version': None, 'files': {}})
     current_file = None
     
-    lines = diff_content.split('\n')
-    
-    for line in lines:
-        # Track which file we're in
-        if line.startswith('--- '):
-            file_path = line[4:].strip()
-            current_file = file_path.split('/')[-1].split('\t')[0] if '/' in file_path else file_path.split('\t')[0]
-        elif line.startswith('+++ '):
-            file_path = line[4:].strip()
-            current_file = file_path.split('/')[-1].split('\t')[0] if '/' in file_path else file_path.split('\t')[0]
-        
-        # Look for removed packages (-)
-        elif line.startswith('-') and not line.startswith('---'):
-            pkg_name, version = parse_package_line(line[1:])
-            if pkg_name and pkg_name not in ['', 'via']:
-                if pkg_name not in changes:
-                    changes[pkg_name] = {'old_version': None, 'new_version': None, 'files': set()}
-                changes[pkg_name]['old_version'] = version
-                changes[pkg_name]['files'].add(current_file)
-        
-        # Look for added packages (+)
-        elif line.startswith('+') and not line.startswith('+++'):
-            pkg_name, version = parse_package_line(line[1:])
-            if pkg_name and pkg_name not in ['', 'via']:
-                if pkg_name not in changes:
-                    changes[pkg_name] = {'old_version': None, 'new_version': None, 'files': set()}
-                changes[pkg_name]['new_version'] = version
-                changes[pkg_name]['files'].add(current_file)
-    
-    # Filter out packages that are just dependency changes (no version change)
-    filtered_changes = {}
-    for pkg_name, change_info in changes.items():
-        # Only include packages where version actually changed or new packages were added
-        if (change_info['old_version'] != change_info['new_version'] and 
-            (change_info['old_version'] is not None or change_info['new_version'] is not None)):
-            # Convert set to list for YAML serialization
-            change_info['files'] = list(change_info['files'])
-            filtered_changes[pkg_name] = change_info
+    for line in diff_lines:
+        line = line.rstrip('\n')
+        # Dispatch once on the first character; context, blank, "diff -ru" and
+        # "Only in" lines are skipped without further tests
+        first = line[:1]
+        if first == '-':
+            header, version_key = '---', 'old_version'
+        elif first == '+':
+            header, version_key = '+++', 'new_version'
+        else:
+            continue
+
+        if line.startswith(header):
+            # Track which file we're in ("--- path" / "+++ path")
+            if line[3:4] == ' ':
+                current_file = _diff_file_name(line[4:].strip())
+            continue
+
+        # Look for removed (-) or added (+) packages. Requirement names start with a
+        # letter, digit or underscore, so blank, comment and option lines are
+        # rejected here without a call into parse_package_line. Only indented
+        # lines pay for an lstrip() copy.
+        payload = line[1:]
+        c = payload[:1]
+        if c == ' ' or c == '\t':
+            c = payload.lstrip()[:1]
+        if not (c.isalnum() or c == '_'):
+            continue
+        pkg_name, version = parse_package_line(payload)
+        if pkg_name and pkg_name not in _SKIP_PKG_NAMES:
+            entry = changes[pkg_name]
+            entry[version_key] = version
+            entry['files'][current_file] = None
     
-    return filtered_changes
+    # Filter out packages that are just dependency changes (no version change).
+    # Only packages whose version actually changed, or that were added or removed,
+    # remain; the insertion-ordered files dict becomes a list for YAML serialization.
+    return {
+        pkg_name: {**change_info, 'files': list(change_info['files'])}
+        for pkg_name, change_info in changes.items()
+        if change_info['old_version'] != change_info['new_version']
+    }
+
+# Static tail shared by every ticket body
+_BODY_FOOTER = """Context:
+- The tickets are pre-emptive of the next release of vLLM
+- There may still be further changes when the next vLLM release is cut
+- This is because they've been updated in upstream vLLM and we need them for the next midstream and later downstream release
+- This ticket is created automagically. Please contact the RHAIIS Midstream team for more information.
+
+For upstream reference, see: https://github.com/vllm-project/vllm
+
+Package License:
+
+This package has been verified to have a license compatible with Red Hat products. Standard Python packages from PyPI are generally MIT, Apache 2.0, or BSD licensed which are acceptable for inclusion.
+"""
 
 def generate_ticket_body(package_name: str, old_version: str, new_version: str, files: List[str]) -> str:
     """Generate the ticket body description based on the template."""
@@ -235,7 +294,7 @@ def generate_ticket_body(package_name: str, old_version: str, new_version: str,
         change_type = "update"
         version_info = f"Update: {package_name} from {old_version} to {new_version}"
     
-    # Generate the body
+    # Generate the body; only the package-specific head is formatted per ticket
     body = f"""Requested Package Name and Version:
 
 {package_name}>={new_version if new_version else old_version}
@@ -248,20 +307,28 @@ This package {change_type} is required for the compatibility with the upcoming v
 
 This change appears in the following vLLM requirement files: {', '.join(files)}
 
-Context:
-- The tickets are pre-emptive of the next release of vLLM
-- There may still be further changes when the next vLLM release is cut
-- This is because they've been updated in upstream vLLM and we need them for the next midstream and later downstream release
-- This ticket is created automagically. Please contact the RHAIIS Midstream team for more information.
+"""
+    
+    return body + _BODY_FOOTER
 
-For upstream reference, see: https://github.com/vllm-project/vllm
+def write_ticket_file(ticket_dir: Path, ticket_data: Dict) -> Path:
+    """
+    Write one ticket YAML file into ticket_dir.
 
-Package License:
+    The YAML is written to a .yaml.tmp file first and moved into place with os.replace,
+    so readers never see a partially written ticket.
+    """
+    ticket_file = ticket_dir / f"{ticket_data['package_name']}.yaml"
+    tmp_file = ticket_file.with_suffix('.yaml.tmp')
+    with open(tmp_file, 'w', buffering=1 << 16) as f:
+        yaml.dump(ticket_data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+    os.replace(tmp_file, ticket_file)
+    return ticket_file
 
-This package has been verified to have a license compatible with Red Hat products. Standard Python packages from PyPI are generally MIT, Apache 2.0, or BSD licensed which are acceptable for inclusion.
-"""
-    
-    return body
+def write_combined_file(combined_file: Path, tickets: List[Dict]):
+    """Write every ticket as one multi-document YAML file, for consumers that want them all at once."""
+    with open(combined_file, 'w', buffering=1 << 16) as f:
+        yaml.dump_all(tickets, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
 def main():
     """Main function to parse diff and generate ticket files."""
@@ -322,6 +389,12 @@ Examples:
         help="Include package removals in the output (default: exclude removals)"
     )
 
+    parser.add_argument(
+        "--combined-file",
+        type=str,
+        help="Also write all tickets as one multi-document YAML file at this path"
+    )
+
     args = parser.parse_args()
     
     if args.diff_file:
@@ -331,10 +404,11 @@ Examples:
             print(f"Error: {diff_path} not found!")
             return
         
-        with open(diff_path, 'r') as f:
-            diff_content = f.read()
-        
         print(f"Reading diff from {diff_path}")
+
+        # Stream the file instead of reading it into memory first
+        with open(diff_path, 'r', buffering=1 << 20) as f:
+            changes = extract_changes_from_diff(f)
     
     elif args.generate_diff:
         # Generate diff from repository
@@ -342,40 +416,33 @@ Examples:
             print("Error: --old-ref and --new-ref are required when using --generate-diff")
             return
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        try:
+            # Generate diff
+            diff_content = generate_requirements_diff(args.repo_url, args.old_ref, args.new_ref)
             
-            try:
-                # Clone repository
-                repo_path = clone_vllm_repo(temp_path)
-                
-                # Generate diff
-                diff_content = generate_requirements_diff(repo_path, args.old_ref, args.new_ref)
-                
-                if not diff_content.strip():
-                    print("No differences found between the specified refs.")
-                    return
-                
-                print(f"Generated diff between {args.old_ref} and {args.new_ref}")
-                
-                # Optionally save the generated diff
-                # Sanitize ref names for filename (replace / with -)
-                old_ref_safe = args.old_ref.replace('/', '-')
-                new_ref_safe = args.new_ref.replace('/', '-')
-                diff_output_path = Path(__file__).parent / f"vllm-reqs-{old_ref_safe}-to-{new_ref_safe}.diff"
-                with open(diff_output_path, 'w') as f:
-                    f.write(diff_content)
-                print(f"Saved diff to {diff_output_path}")
-                
-            except subprocess.CalledProcessError as e:
-                print(f"Error generating diff: {e}")
-                return
-            except Exception as e:
-                print(f"Unexpected error: {e}")
+            if not diff_content.strip():
+                print("No differences found between the specified refs.")
                 return
-    
-    # Extract changes
-    changes = extract_changes_from_diff(diff_content)
+            
+            print(f"Generated diff between {args.old_ref} and {args.new_ref}")
+            
+            # Optionally save the generated diff
+            # Sanitize ref names for filename (replace / with -)
+            old_ref_safe = args.old_ref.replace('/', '-')
+            new_ref_safe = args.new_ref.replace('/', '-')
+            diff_output_path = Path(__file__).parent / f"vllm-reqs-{old_ref_safe}-to-{new_ref_safe}.diff"
+            with open(diff_output_path, 'w') as f:
+                f.write(diff_content)
+            print(f"Saved diff to {diff_output_path}")
+
+            changes = extract_changes_from_diff(io.StringIO(diff_content))
+            
+        except subprocess.CalledProcessError as e:
+            print(f"Error generating diff: {e}")
+            return
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            return
 
     # Filter out removals unless --include-removals is specified
     if not args.include_removals:
@@ -386,6 +453,7 @@ Examples:
     # Create ticket files
     ticket_dir = Path(__file__).parent / args.output_dir
     ticket_dir.mkdir(exist_ok=True)
+    all_tickets = []
 
     for package_name, change_info in changes.items():
         old_version = change_info['old_version']
@@ -405,12 +473,21 @@ Examples:
             'body_description': generate_ticket_body(package_name, old_version, new_version, files)
         }
         
-        # Write ticket file
-        ticket_file = ticket_dir / f"{package_name}.yaml"
-        with open(ticket_file, 'w') as f:
-            yaml.dump(ticket_data, f, default_flow_style=False, sort_keys=False)
+        all_tickets.append(ticket_data)
+    
+    # Write ticket files and the optional combined file; they are independent, so
+    # emit them all in parallel
+    with ThreadPoolExecutor(max_workers=min(8, len(all_tickets) + 1)) as executor:
+        combined = None
+        if args.combined_file:
+            combined = executor.submit(write_combined_file, Path(args.combined_file), all_tickets)
+        list(executor.map(lambda t: write_ticket_file(ticket_dir, t), all_tickets))
+        if combined is not None:
+            combined.result()
     
     print(f"\nGenerated {len(changes)} ticket files in {ticket_dir}")
+    if args.combined_file:
+        print(f"Wrote combined tickets to {args.combined_file}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Shared persistent cache of the vLLM repository, fetched one ref at a time.
+Used by both generate_component_versions.py and parse_diff.py.
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Tuple
+
+from git_blob_reader import GIT_ENV
+
+_COMMIT_HASH_RE = re.compile(r'[0-9a-f]{7,40}')
+
+CACHE_ROOT = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "vllm-deps-autofiler"
+
+
+def is_commit_hash(ref: str) -> bool:
+    """Return True if ref looks like an abbreviated or full commit hash."""
+    return _COMMIT_HASH_RE.fullmatch(ref) is not None
+
+
+def resolve_abbreviated_commit(cache_dir: Path, repo_url: str, ref: str) -> str:
+    """
+    Resolve an abbreviated commit hash to the full commit id.
+
+    Servers only accept full object ids in a fetch, so the commit history of all
+    branches and tags is fetched first (commits only, --filter=tree:0) and the
+    abbreviation is resolved locally.
+    """
+    print(f"Fetching commit history from {repo_url} to resolve {ref}...", file=sys.stderr)
+    subprocess.run([
+        "git", "-C", str(cache_dir), "fetch", "-q", "--filter=tree:0", "origin",
+        "+refs/heads/*:refs/remotes/origin/*", "+refs/tags/*:refs/tags/*"
+    ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+
+    resolved = subprocess.run([
+        "git", "-C", str(cache_dir), "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"
+    ], capture_output=True, text=True, env=GIT_ENV)
+    if resolved.returncode != 0:
+        raise ValueError(
+            f"Could not resolve abbreviated commit {ref} (unknown or ambiguous); "
+            "pass the full 40-character hash"
+        )
+    return resolved.stdout.strip()
+
+
+def init_cache(cache_dir: Path, repo_url: str):
+    """
+    Create the bare cache of repo_url at cache_dir.
+
+    The repository is set up in a sibling temporary directory and renamed into place,
+    so an interrupted or concurrent first run never leaves a cache without its remote.
+    """
+    print(f"Initializing vLLM repository cache for {repo_url}...", file=sys.stderr)
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f"{cache_dir.name}.", suffix=".tmp", dir=cache_dir.parent))
+    try:
+        subprocess.run([
+            "git", "init", "--bare", "-q", str(tmp_dir)
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+        subprocess.run([
+            "git", "-C", str(tmp_dir), "remote", "add", "origin", repo_url
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+        try:
+            os.rename(tmp_dir, cache_dir)
+        except OSError:
+            if not cache_dir.exists():
+                raise
+            # A concurrent run put its cache in place first; use that one
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def cache_lock(cache_dir: Path):
+    """Hold an exclusive lock on cache_dir for the duration of the with block."""
+    with open(f"{cache_dir}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)  # Released when the file is closed
+        yield
+
+
+def get_or_update_cache(repo_url: str, ref: str) -> Tuple[Path, str]:
+    """
+    Fetch ref into a persistent bare mirror of repo_url and return (cache_dir, commit).
+
+    The mirror lives under CACHE_ROOT keyed by sha256(repo_url). Only the single
+    requested ref is fetched, shallow and treeless (--depth=1 --filter=tree:0), so
+    trees and blobs are pulled lazily for just the snapshot that is read. Nothing is
+    fetched when ref is a tag or commit that is already cached, since those are immutable.
+    """
+    key = hashlib.sha256(repo_url.encode()).hexdigest()
+    cache_dir = CACHE_ROOT / f"{key}.git"
+
+    if not cache_dir.exists():
+        init_cache(cache_dir, repo_url)
+    elif subprocess.run([
+        "git", "-C", str(cache_dir), "remote", "get-url", "origin"
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=GIT_ENV).returncode != 0:
+        # Left without its remote by an interrupted initialization of an older version
+        subprocess.run([
+            "git", "-C", str(cache_dir), "remote", "add", "origin", repo_url
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+
+    cached = f"{ref}^{{commit}}" if is_commit_hash(ref) else f"refs/tags/{ref}"
+    cached_check = subprocess.run([
+        "git", "-C", str(cache_dir), "rev-parse", "--verify", "--quiet", cached
+    ], capture_output=True, text=True, env=GIT_ENV)
+    if cached_check.returncode == 0:
+        print(f"Using cached {ref}", file=sys.stderr)
+        return cache_dir, cached_check.stdout.strip()
+
+    # Fetches (and FETCH_HEAD) of concurrent runs on the same cache must not interleave
+    with cache_lock(cache_dir):
+        if is_commit_hash(ref) and len(ref) < 40:
+            return cache_dir, resolve_abbreviated_commit(cache_dir, repo_url, ref)
+
+        print(f"Fetching {ref} from {repo_url}...", file=sys.stderr)
+        subprocess.run([
+            "git", "-C", str(cache_dir), "fetch", "-q", "--depth=1", "--filter=tree:0", "origin", ref
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+
+        # FETCH_HEAD line format: "<sha>\t\t<tag|branch> '<name>' of <url>"
+        fetch_head = (cache_dir / "FETCH_HEAD").read_text().split('\n')[0]
+        commit, _, description = fetch_head.partition('\t')
+        if description.lstrip('\t').startswith("tag "):
+            subprocess.run([
+                "git", "-C", str(cache_dir), "update-ref", f"refs/tags/{ref}", commit
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+
+    return cache_dir, commit
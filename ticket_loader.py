@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared loading of the ticket YAML files written by parse_diff.py.
+Used by both generate_jira_tickets.py and jira_generator.py.
+"""
+
+import yaml
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Prefer the LibYAML C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# The JSON sidecar cache uses orjson when it is installed, which reads and writes
+# UTF-8 bytes directly; the stdlib json module is the fallback.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+def load_ticket_file(yaml_file: Path) -> Dict:
+    """
+    Load one ticket YAML file through a JSON sidecar cache.
+
+    The cache (<name>.yaml.json) is reused while it is at least as new as the YAML
+    file, and rewritten atomically whenever the YAML has changed. Tickets holding
+    values JSON cannot represent as-is (dates, ...) are not cached.
+    """
+    cache_file = yaml_file.with_suffix('.yaml.json')
+    try:
+        if cache_file.stat().st_mtime_ns >= yaml_file.stat().st_mtime_ns:
+            return _json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache, fall back to the YAML
+
+    with open(yaml_file, 'r') as f:
+        ticket_data = yaml.load(f, Loader=SafeLoader)
+
+    tmp_file = cache_file.with_suffix(f'.json.{os.getpid()}.tmp')
+    try:
+        data = _json_dumps(ticket_data)
+        # Only cache what survives the JSON round trip unchanged; e.g. an unquoted
+        # date in a hand-edited ticket would otherwise come back as a str
+        if _json_loads(data) == ticket_data:
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass  # Caching is best effort (e.g. read-only ticket directory, non-JSON values)
+
+    return ticket_data
+
+
+@lru_cache(maxsize=None)
+def load_tickets(ticket_dir: str) -> Tuple[Dict, ...]:
+    """
+    Load all ticket YAML files in ticket_dir, sorted by package name.
+
+    The result is memoized per directory for the life of the process, so the tickets
+    are shared between callers; treat them as read-only and copy before modifying.
+    """
+    files = list(Path(ticket_dir).glob("*.yaml"))
+    if not files:
+        return ()
+
+    def parse_one(yaml_file: Path) -> Dict:
+        ticket_data = load_ticket_file(yaml_file)
+        ticket_data['filename'] = yaml_file.name
+        return ticket_data
+
+    # Overlap the per-file open/read syscalls across ticket files
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        tickets = list(executor.map(parse_one, files))
+    return tuple(sorted(tickets, key=lambda x: x['package_name']))